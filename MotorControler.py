@@ -16,99 +16,128 @@ Example:
 """
 
 import importlib
-import inspect
+import logging
 import os
-from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Dict, Any, Optional, Type, List
+from typing import Dict, Any, Iterable, Iterator, Optional, Type, List, Tuple, Union
 
+from motor_bases import (MotorDriver, ServoDriver, StepperDriver, BLDCDriver,
+                         DRIVER_REGISTRY, register_driver)
 
-class MotorType(Enum):
-    """Enumeration of supported motor types."""
+_log = logging.getLogger(__name__)
+
+
+class MotorType:
+    """
+    Supported motor types.
+    
+    The members are plain strings, so "servo", "stepper" and "bldc" can be
+    passed wherever a MotorType is expected.
+    """
     SERVO = "servo"
     STEPPER = "stepper"
     BLDC = "bldc"
 
 
-class MotorDriver(ABC):
-    """Abstract base class for motor drivers."""
-    
-    @abstractmethod
-    def initialize(self, **kwargs) -> bool:
-        """Initialize the motor driver with the given parameters."""
-        pass
-    
-    @abstractmethod
-    def shutdown(self) -> bool:
-        """Shutdown the motor driver and release resources."""
-        pass
-    
-    @abstractmethod
-    def get_status(self) -> Dict[str, Any]:
-        """Get the current status of the motor."""
-        pass
+# Placeholder in status_table columns for fields a motor does not report
+MISSING = object()
 
+# Base classes that are never valid concrete drivers
+_ABSTRACT_BASES = frozenset({MotorDriver, ServoDriver, StepperDriver, BLDCDriver})
 
-class ServoDriver(MotorDriver):
-    """Base class for servo motor drivers."""
-    
-    @abstractmethod
-    def set_position(self, position: float) -> bool:
-        """Set the servo position in degrees (0-180)."""
-        pass
-    
-    @abstractmethod
-    def get_position(self) -> float:
-        """Get the current servo position in degrees."""
-        pass
+# Driver base class required for each motor type
+_TYPE_TO_BASE = {
+    "servo": ServoDriver,
+    "stepper": StepperDriver,
+    "bldc": BLDCDriver,
+}
 
 
-class StepperDriver(MotorDriver):
-    """Base class for stepper motor drivers."""
-    
-    @abstractmethod
-    def move_steps(self, steps: int, direction: bool = True) -> bool:
-        """Move the stepper motor by the specified number of steps."""
-        pass
-    
-    @abstractmethod
-    def set_speed(self, rpm: float) -> bool:
-        """Set the stepper motor speed in RPM."""
-        pass
-    
-    @abstractmethod
-    def get_position(self) -> int:
-        """Get the current position in steps."""
-        pass
+# Commands accepted by MotorController.apply_batch for each motor type,
+# named as on Motor and mapped to the driver method that implements them
+_BATCH_COMMANDS = {
+    "servo": {
+        "set_position": "set_position",
+        "get_position": "get_position",
+    },
+    "stepper": {
+        "move_steps": "move_steps",
+        "set_speed": "set_speed",
+        "get_speed": "get_speed",
+        "get_stepper_position": "get_position",
+    },
+    "bldc": {
+        "set_speed": "set_speed",
+        "set_direction": "set_direction",
+        "get_speed": "get_speed",
+    },
+}
 
 
-class BLDCDriver(MotorDriver):
-    """Base class for BLDC motor drivers."""
-    
-    @abstractmethod
-    def set_speed(self, rpm: float) -> bool:
-        """Set the BLDC motor speed in RPM."""
-        pass
-    
-    @abstractmethod
-    def set_direction(self, clockwise: bool) -> bool:
-        """Set the BLDC motor direction."""
-        pass
-    
-    @abstractmethod
-    def get_speed(self) -> float:
-        """Get the current BLDC motor speed in RPM."""
-        pass
+# Status fields Motor reports itself, overriding any the driver returns
+_MOTOR_STATUS_KEYS = frozenset({"name", "type", "initialized"})
+
+
+def _unsupported(message: str):
+    """Return a callable that raises TypeError for an unsupported operation."""
+    def method(*args, **kwargs):
+        raise TypeError(message)
+    return method
 
 
 class Motor:
-    """Universal motor interface that wraps a specific motor driver."""
+    """
+    Universal motor interface that wraps a specific motor driver.
+    
+    Type-specific operations (set_position, get_position, move_steps,
+    get_stepper_position, set_direction, set_speed, get_speed) are bound to
+    the driver when the motor is created. Operations the driver does not
+    support raise TypeError.
+    """
+    
+    __slots__ = ("name", "motor_type", "driver", "initialized",
+                 "set_position", "get_position", "move_steps", "get_stepper_position",
+                 "set_direction", "set_speed", "get_speed")
     
-    def __init__(self, name: str, motor_type: MotorType, driver: MotorDriver):
+    def __init__(self, name: str, motor_type: str, driver: MotorDriver):
         self.name = name
         self.motor_type = motor_type
         self.driver = driver
         self.initialized = False
+        
+        # Bind driver capabilities once so calls skip per-call type checks.
+        # Each ABC check runs once here; nothing on the call path uses isinstance.
+        is_servo = isinstance(driver, ServoDriver)
+        is_stepper = isinstance(driver, StepperDriver)
+        is_bldc = isinstance(driver, BLDCDriver)
+        
+        if is_servo:
+            self.set_position = driver.set_position
+            self.get_position = driver.get_position
+        else:
+            self.set_position = self.get_position = _unsupported(
+                f"Motor {name} is not a servo motor")
+        
+        if is_stepper:
+            self.move_steps = driver.move_steps
+            self.get_stepper_position = driver.get_position
+        else:
+            self.move_steps = self.get_stepper_position = _unsupported(
+                f"Motor {name} is not a stepper motor")
+        
+        if is_bldc:
+            self.set_direction = driver.set_direction
+        else:
+            self.set_direction = _unsupported(f"Motor {name} is not a BLDC motor")
+        
+        if is_stepper:
+            self.set_speed = driver.set_speed
+            self.get_speed = driver.get_speed
+        elif is_bldc:
+            self.set_speed = driver.set_speed
+            self.get_speed = driver.get_speed
+        else:
+            self.set_speed = self.get_speed = _unsupported(
+                f"Motor {name} does not support speed control")
     
     def initialize(self, **kwargs) -> bool:
         """Initialize the motor driver."""
@@ -125,63 +154,25 @@ class Motor:
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the motor."""
         status = self.driver.get_status()
-        status.update({
-            "name": self.name,
-            "type": self.motor_type.value,
-            "initialized": self.initialized
-        })
+        status["name"] = self.name
+        status["type"] = self.motor_type
+        status["initialized"] = self.initialized
         return status
     
-    # Servo-specific methods
-    def set_position(self, position: float) -> bool:
-        """Set the servo position in degrees (0-180)."""
-        if not isinstance(self.driver, ServoDriver):
-            raise TypeError(f"Motor {self.name} is not a servo motor")
-        return self.driver.set_position(position)
-    
-    def get_position(self) -> float:
-        """Get the current servo position in degrees."""
-        if not isinstance(self.driver, ServoDriver):
-            raise TypeError(f"Motor {self.name} is not a servo motor")
-        return self.driver.get_position()
-    
-    # Stepper-specific methods
-    def move_steps(self, steps: int, direction: bool = True) -> bool:
-        """Move the stepper motor by the specified number of steps."""
-        if not isinstance(self.driver, StepperDriver):
-            raise TypeError(f"Motor {self.name} is not a stepper motor")
-        return self.driver.move_steps(steps, direction)
-    
-    def set_speed(self, rpm: float) -> bool:
-        """Set the motor speed in RPM."""
-        if isinstance(self.driver, StepperDriver):
-            return self.driver.set_speed(rpm)
-        elif isinstance(self.driver, BLDCDriver):
-            return self.driver.set_speed(rpm)
-        else:
-            raise TypeError(f"Motor {self.name} does not support speed control")
-    
-    def get_stepper_position(self) -> int:
-        """Get the current stepper position in steps."""
-        if not isinstance(self.driver, StepperDriver):
-            raise TypeError(f"Motor {self.name} is not a stepper motor")
-        return self.driver.get_position()
-    
-    # BLDC-specific methods
-    def set_direction(self, clockwise: bool) -> bool:
-        """Set the BLDC motor direction."""
-        if not isinstance(self.driver, BLDCDriver):
-            raise TypeError(f"Motor {self.name} is not a BLDC motor")
-        return self.driver.set_direction(clockwise)
-    
-    def get_speed(self) -> float:
-        """Get the current motor speed in RPM."""
-        if isinstance(self.driver, StepperDriver):
-            return self.driver.speed
-        elif isinstance(self.driver, BLDCDriver):
-            return self.driver.get_speed()
-        else:
-            raise TypeError(f"Motor {self.name} does not support speed control")
+    def iter_status(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the motor's status as (key, value) pairs.
+        
+        Yields the same fields as get_status without building a merged
+        status dict. Unlike get_status, name, type and initialized come
+        first, followed by the driver's fields.
+        """
+        yield "name", self.name
+        yield "type", self.motor_type
+        yield "initialized", self.initialized
+        for item in self.driver.get_status().items():
+            if item[0] not in _MOTOR_STATUS_KEYS:
+                yield item
 
 
 class MotorController:
@@ -195,41 +186,54 @@ class MotorController:
             driver_path: Path to the directory containing motor driver modules.
         """
         self.motors: Dict[str, Motor] = {}
+        # Motors in a flat list for fast iteration, with each name's list index
+        self._motor_list: List[Motor] = []
+        self._motor_index: Dict[str, int] = {}
         self.driver_path = driver_path
         self.driver_cache: Dict[str, Type[MotorDriver]] = {}
+        # Whether a driver class is compatible with a motor type
+        self._compat_cache: Dict[tuple, bool] = {}
     
     def _load_driver(self, driver_name: str) -> Type[MotorDriver]:
         """Load a motor driver module by name."""
         if driver_name in self.driver_cache:
             return self.driver_cache[driver_name]
         
+        driver_class = DRIVER_REGISTRY.get(f"{self.driver_path}.{driver_name}")
+        if driver_class is None:
+            driver_class = self._import_driver(driver_name)
+        self.driver_cache[driver_name] = driver_class
+        return driver_class
+    
+    def _import_driver(self, driver_name: str) -> Type[MotorDriver]:
+        """Import a driver module and find its driver class."""
         try:
-            # Try to import the driver module
+            # Importing the module registers any decorated driver classes
             module = importlib.import_module(f"{self.driver_path}.{driver_name}")
             
-            # Find the driver class in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, MotorDriver) and 
-                    obj != MotorDriver and 
-                    obj != ServoDriver and 
-                    obj != StepperDriver and 
-                    obj != BLDCDriver):
-                    self.driver_cache[driver_name] = obj
+            driver_class = DRIVER_REGISTRY.get(module.__name__)
+            if driver_class is not None:
+                return driver_class
+            
+            # Fall back to finding an unregistered driver class in the module
+            for obj in vars(module).values():
+                if (isinstance(obj, type) and
+                    issubclass(obj, MotorDriver) and
+                    obj not in _ABSTRACT_BASES):
                     return obj
             
             raise ImportError(f"No valid driver class found in {driver_name}")
         except ImportError as e:
             raise ImportError(f"Failed to load driver {driver_name}: {e}")
     
-    def create_motor(self, name: str, motor_type: MotorType, 
+    def create_motor(self, name: str, motor_type: str, 
                     driver_name: str, **kwargs) -> Motor:
         """
         Create a new motor with the specified driver.
         
         Args:
             name: Unique name for the motor.
-            motor_type: Type of motor (SERVO, STEPPER, BLDC).
+            motor_type: Type of motor (a MotorType value: SERVO, STEPPER, BLDC).
             driver_name: Name of the driver module to use.
             **kwargs: Additional parameters for the motor driver.
             
@@ -245,19 +249,25 @@ class MotorController:
             raise ValueError(f"Motor with name {name} already exists")
         
         driver_class = self._load_driver(driver_name)
-        driver = driver_class()
         
-        # Verify driver compatibility with motor type
-        if motor_type == MotorType.SERVO and not isinstance(driver, ServoDriver):
-            raise TypeError(f"Driver {driver_name} is not compatible with servo motors")
-        elif motor_type == MotorType.STEPPER and not isinstance(driver, StepperDriver):
-            raise TypeError(f"Driver {driver_name} is not compatible with stepper motors")
-        elif motor_type == MotorType.BLDC and not isinstance(driver, BLDCDriver):
-            raise TypeError(f"Driver {driver_name} is not compatible with BLDC motors")
+        # Verify driver compatibility with motor type before instantiating it
+        key = (driver_class, motor_type)
+        compatible = self._compat_cache.get(key)
+        if compatible is None:
+            base = _TYPE_TO_BASE.get(motor_type)
+            compatible = base is not None and issubclass(driver_class, base)
+            self._compat_cache[key] = compatible
+        if not compatible:
+            raise TypeError(f"Driver {driver_name} is not compatible with {motor_type} motors")
         
+        driver = driver_class()
         motor = Motor(name, motor_type, driver)
         motor.initialize(**kwargs)
+        
         self.motors[name] = motor
+        self._motor_index[name] = len(self._motor_list)
+        self._motor_list.append(motor)
+        _log.debug("Created %s motor %s using driver %s", motor_type, name, driver_name)
         return motor
     
     def get_motor(self, name: str) -> Optional[Motor]:
@@ -267,39 +277,125 @@ class MotorController:
     def remove_motor(self, name: str) -> bool:
         """Remove a motor by name."""
         if name in self.motors:
-            motor = self.motors[name]
+            motor = self.motors.pop(name)
             motor.shutdown()
-            del self.motors[name]
+            
+            # Swap the last motor into the removed slot, then pop
+            index = self._motor_index.pop(name)
+            last = self._motor_list.pop()
+            if last is not motor:
+                self._motor_list[index] = last
+                self._motor_index[last.name] = index
             return True
         return False
     
+    def apply_batch(self, commands: Iterable[Tuple[Union[Motor, str], str, tuple]]) -> List[Any]:
+        """
+        Apply a batch of commands across motors.
+        
+        Commands are grouped per motor and each group is handed to that
+        motor's driver in one submit_many call, preserving the order of
+        commands for each motor.
+        
+        Args:
+            commands: (motor, command, args) tuples, where motor is a Motor or
+                a motor name and command names a Motor operation supported by
+                that motor type: set_position, get_position, move_steps,
+                get_stepper_position, set_direction, set_speed or get_speed.
+            
+        Returns:
+            The result of each command, in the order given.
+            
+        Raises:
+            KeyError: If a motor name is unknown.
+            TypeError: If a motor does not support a command.
+        """
+        # Validate everything first so a bad command submits nothing
+        batches: Dict[Motor, Tuple[List[int], List[Tuple[str, tuple]]]] = {}
+        count = 0
+        for motor, command, args in commands:
+            if isinstance(motor, str):
+                motor = self.motors[motor]
+            method = _BATCH_COMMANDS.get(motor.motor_type, {}).get(command)
+            if method is None:
+                raise TypeError(f"Motor {motor.name} does not support {command}")
+            batch = batches.get(motor)
+            if batch is None:
+                batch = batches[motor] = ([], [])
+            batch[0].append(count)
+            batch[1].append((method, args))
+            count += 1
+        
+        results: List[Any] = [None] * count
+        for motor, (indices, driver_commands) in batches.items():
+            for index, result in zip(indices, motor.driver.submit_many(driver_commands)):
+                results[index] = result
+        return results
+    
+    def iter_status(self, name: str) -> Iterator[Tuple[str, Any]]:
+        """Iterate over a motor's status as (key, value) pairs."""
+        return self.motors[name].iter_status()
+    
+    def status_table(self) -> Tuple[List[str], Dict[str, List[Any]]]:
+        """
+        Get the status of all motors as columns.
+        
+        Returns:
+            A (names, columns) tuple. names lists the motor names, and columns
+            maps each status field to a list of values aligned with names.
+            Fields a motor does not report are MISSING for that motor.
+        """
+        motors = self._motor_list
+        count = len(motors)
+        names: List[str] = []
+        columns: Dict[str, List[Any]] = {}
+        for row, motor in enumerate(motors):
+            names.append(motor.name)
+            for key, value in motor.iter_status():
+                if key == "name":
+                    continue
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [MISSING] * count
+                column[row] = value
+        return names, columns
+    
     def list_motors(self) -> List[Dict[str, Any]]:
         """List all motors and their status."""
-        return [motor.get_status() for motor in self.motors.values()]
+        return [motor.get_status() for motor in self._motor_list]
     
     def shutdown(self):
         """Shutdown all motors."""
-        for motor in self.motors.values():
-            motor.shutdown()
+        # Call the drivers directly; the motors are discarded afterwards.
+        # Motors stay registered until every driver has been shut down, so
+        # if a driver raises, shutdown can be called again to reach the rest.
+        for motor in self._motor_list:
+            if motor.initialized:
+                motor.initialized = not motor.driver.shutdown()
+        self._motor_list.clear()
+        self._motor_index.clear()
         self.motors.clear()
         self.driver_cache.clear()
+        self._compat_cache.clear()
 
 
 # Example driver implementations
 class ExampleServoDriver(ServoDriver):
     """Example implementation of a servo driver."""
     
+    __slots__ = ("position", "initialized")
+    
     def __init__(self):
         self.position = 0.0
         self.initialized = False
     
     def initialize(self, **kwargs) -> bool:
-        print(f"Initializing servo driver with params: {kwargs}")
+        _log.debug("Initializing servo driver with params: %s", kwargs)
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
-        print("Shutting down servo driver")
+        _log.debug("Shutting down servo driver")
         self.initialized = False
         return True
     
@@ -313,7 +409,7 @@ class ExampleServoDriver(ServoDriver):
         if not self.initialized:
             return False
         self.position = max(0.0, min(180.0, position))
-        print(f"Setting servo position to {self.position} degrees")
+        _log.debug("Setting servo position to %s degrees", self.position)
         return True
     
     def get_position(self) -> float:
@@ -323,18 +419,20 @@ class ExampleServoDriver(ServoDriver):
 class ExampleStepperDriver(StepperDriver):
     """Example implementation of a stepper driver."""
     
+    __slots__ = ("position", "speed", "initialized")
+    
     def __init__(self):
         self.position = 0
         self.speed = 0.0
         self.initialized = False
     
     def initialize(self, **kwargs) -> bool:
-        print(f"Initializing stepper driver with params: {kwargs}")
+        _log.debug("Initializing stepper driver with params: %s", kwargs)
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
-        print("Shutting down stepper driver")
+        _log.debug("Shutting down stepper driver")
         self.initialized = False
         return True
     
@@ -352,14 +450,14 @@ class ExampleStepperDriver(StepperDriver):
             self.position += steps
         else:
             self.position -= steps
-        print(f"Moving stepper {steps} steps {'forward' if direction else 'backward'}")
+        _log.debug("Moving stepper %s steps %s", steps, "forward" if direction else "backward")
         return True
     
     def set_speed(self, rpm: float) -> bool:
         if not self.initialized:
             return False
         self.speed = max(0.0, rpm)
-        print(f"Setting stepper speed to {self.speed} RPM")
+        _log.debug("Setting stepper speed to %s RPM", self.speed)
         return True
     
     def get_position(self) -> int:
@@ -369,18 +467,20 @@ class ExampleStepperDriver(StepperDriver):
 class ExampleBLDCDriver(BLDCDriver):
     """Example implementation of a BLDC driver."""
     
+    __slots__ = ("speed", "clockwise", "initialized")
+    
     def __init__(self):
         self.speed = 0.0
         self.clockwise = True
         self.initialized = False
     
     def initialize(self, **kwargs) -> bool:
-        print(f"Initializing BLDC driver with params: {kwargs}")
+        _log.debug("Initializing BLDC driver with params: %s", kwargs)
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
-        print("Shutting down BLDC driver")
+        _log.debug("Shutting down BLDC driver")
         self.initialized = False
         return True
     
@@ -395,14 +495,14 @@ class ExampleBLDCDriver(BLDCDriver):
         if not self.initialized:
             return False
         self.speed = max(0.0, rpm)
-        print(f"Setting BLDC speed to {self.speed} RPM")
+        _log.debug("Setting BLDC speed to %s RPM", self.speed)
         return True
     
     def set_direction(self, clockwise: bool) -> bool:
         if not self.initialized:
             return False
         self.clockwise = clockwise
-        print(f"Setting BLDC direction to {'clockwise' if clockwise else 'counterclockwise'}")
+        _log.debug("Setting BLDC direction to %s", "clockwise" if clockwise else "counterclockwise")
         return True
     
     def get_speed(self) -> float:
@@ -411,6 +511,8 @@ class ExampleBLDCDriver(BLDCDriver):
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     # Create a motor controller
     controller = MotorController()
     
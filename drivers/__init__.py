@@ -2,14 +2,34 @@
 Motor Drivers Package
 
 This package contains implementations of motor drivers for different types of motors.
+Driver classes are imported lazily on first attribute access, so importing the
+package does not load every driver module.
 """
 
-from .example_servo_driver import ExampleServoDriver
-from .example_stepper_driver import ExampleStepperDriver
-from .example_bldc_driver import ExampleBLDCDriver
+import importlib
+
+_LAZY = {
+    'ExampleServoDriver': '.example_servo_driver',
+    'ExampleStepperDriver': '.example_stepper_driver',
+    'ExampleBLDCDriver': '.example_bldc_driver',
+}
 
 __all__ = [
     'ExampleServoDriver',
     'ExampleStepperDriver',
     'ExampleBLDCDriver',
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a driver class on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
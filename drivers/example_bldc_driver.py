@@ -6,13 +6,21 @@ This module provides an example implementation of a BLDC motor driver.
 In a real implementation, this would interface with hardware.
 """
 
-from motorControl import BLDCDriver
+import logging
+
+from motor_bases import BLDCDriver, register_driver
 from typing import Dict, Any
 
+_log = logging.getLogger(__name__)
+
 
+@register_driver
 class ExampleBLDCDriver(BLDCDriver):
     """Example implementation of a BLDC driver."""
     
+    __slots__ = ("speed", "clockwise", "initialized", "pwm_pin",
+                 "hall_sensor_pins", "max_speed", "_duty_scale")
+    
     def __init__(self):
         self.speed = 0.0
         self.clockwise = True
@@ -20,33 +28,44 @@ class ExampleBLDCDriver(BLDCDriver):
         self.pwm_pin = None
         self.hall_sensor_pins = None
         self.max_speed = 10000  # Maximum RPM
+        self._duty_scale = 100.0 / self.max_speed
     
-    def initialize(self, **kwargs) -> bool:
+    def initialize(self, *, pwm_pin=None, hall_sensor_pins=(),
+                   max_speed: float = 10000, **extras) -> bool:
         """Initialize the BLDC driver with the given parameters."""
-        print(f"Initializing BLDC driver with params: {kwargs}")
+        _log.debug("Initializing BLDC driver")
+        if extras:
+            _log.debug("Ignoring unsupported parameters: %s", extras)
         
         # Required parameters
-        self.pwm_pin = kwargs.get('pwm_pin')
+        self.pwm_pin = pwm_pin
         
         if self.pwm_pin is None:
-            print("Error: pwm_pin parameter is required")
+            _log.error("pwm_pin parameter is required")
             return False
         
         # Optional parameters
-        self.hall_sensor_pins = kwargs.get('hall_sensor_pins', [])
-        self.max_speed = kwargs.get('max_speed', 10000)
+        self.hall_sensor_pins = hall_sensor_pins
+        self.max_speed = max_speed
         
-        print(f"Using GPIO pin {self.pwm_pin} for PWM control")
+        if self.max_speed <= 0:
+            _log.error("max_speed must be positive")
+            return False
+        
+        # PWM duty cycle (%) per RPM, so set_speed multiplies instead of divides
+        self._duty_scale = 100.0 / self.max_speed
+        
+        _log.debug("Using GPIO pin %s for PWM control", self.pwm_pin)
         if self.hall_sensor_pins:
-            print(f"Hall sensor pins: {self.hall_sensor_pins}")
-        print(f"Maximum speed: {self.max_speed} RPM")
+            _log.debug("Hall sensor pins: %s", self.hall_sensor_pins)
+        _log.debug("Maximum speed: %s RPM", self.max_speed)
         
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
         """Shutdown the BLDC driver and release resources."""
-        print("Shutting down BLDC driver")
+        _log.debug("Shutting down BLDC driver")
         self.initialized = False
         return True
     
@@ -64,35 +83,34 @@ class ExampleBLDCDriver(BLDCDriver):
     def set_speed(self, rpm: float) -> bool:
         """Set the BLDC motor speed in RPM."""
         if not self.initialized:
-            print("Error: BLDC driver not initialized")
+            _log.error("BLDC driver not initialized")
             return False
         
         if rpm < 0:
-            print("Error: speed cannot be negative")
+            _log.error("speed cannot be negative")
             return False
         
         # Clamp speed to maximum
         self.speed = min(rpm, self.max_speed)
         
         # In a real implementation, this would set PWM duty cycle based on speed
-        # PWM duty cycle = (speed / max_speed) * 100%
-        duty_cycle = (self.speed / self.max_speed) * 100
-        
-        print(f"Setting BLDC speed to {self.speed} RPM (PWM duty cycle: {duty_cycle:.1f}%)")
-        print(f"  PWM pin: {self.pwm_pin}")
+        if _log.isEnabledFor(logging.DEBUG):
+            duty_cycle = self.speed * self._duty_scale
+            _log.debug("Setting BLDC speed to %s RPM (PWM duty cycle: %.1f%%) on PWM pin %s",
+                       self.speed, duty_cycle, self.pwm_pin)
         
         return True
     
     def set_direction(self, clockwise: bool) -> bool:
         """Set the BLDC motor direction."""
         if not self.initialized:
-            print("Error: BLDC driver not initialized")
+            _log.error("BLDC driver not initialized")
             return False
         
         self.clockwise = clockwise
         
         # In a real implementation, this would set the direction control pins
-        print(f"Setting BLDC direction to {'clockwise' if clockwise else 'counterclockwise'}")
+        _log.debug("Setting BLDC direction to %s", "clockwise" if clockwise else "counterclockwise")
         
         return True
     
@@ -6,32 +6,44 @@ This module provides an example implementation of a servo motor driver.
 In a real implementation, this would interface with hardware.
 """
 
-from motorControl import ServoDriver
+import logging
+import time
+
+from motor_bases import ServoDriver, register_driver
 from typing import Dict, Any
 
+_log = logging.getLogger(__name__)
+
 
+@register_driver
 class ExampleServoDriver(ServoDriver):
     """Example implementation of a servo driver."""
     
+    __slots__ = ("position", "initialized", "pin", "simulate_timing")
+    
     def __init__(self):
         self.position = 0.0
         self.initialized = False
         self.pin = None
+        self.simulate_timing = True
     
-    def initialize(self, **kwargs) -> bool:
+    def initialize(self, *, pin=None, simulate_timing: bool = True, **extras) -> bool:
         """Initialize the servo driver with the given parameters."""
-        print(f"Initializing servo driver with params: {kwargs}")
-        self.pin = kwargs.get('pin')
+        _log.debug("Initializing servo driver")
+        if extras:
+            _log.debug("Ignoring unsupported parameters: %s", extras)
+        self.pin = pin
         if self.pin is None:
-            print("Error: pin parameter is required")
+            _log.error("pin parameter is required")
             return False
-        print(f"Using GPIO pin {self.pin} for servo control")
+        self.simulate_timing = simulate_timing
+        _log.debug("Using GPIO pin %s for servo control", self.pin)
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
         """Shutdown the servo driver and release resources."""
-        print("Shutting down servo driver")
+        _log.debug("Shutting down servo driver")
         self.initialized = False
         return True
     
@@ -46,18 +58,18 @@ class ExampleServoDriver(ServoDriver):
     def set_position(self, position: float) -> bool:
         """Set the servo position in degrees (0-180)."""
         if not self.initialized:
-            print("Error: servo driver not initialized")
+            _log.error("servo driver not initialized")
             return False
         
         # Clamp position to valid range
         self.position = max(0.0, min(180.0, position))
         
         # In a real implementation, this would send commands to the hardware
-        print(f"Setting servo on pin {self.pin} to {self.position} degrees")
+        _log.debug("Setting servo on pin %s to %s degrees", self.pin, self.position)
         
         # Simulate hardware delay
-        import time
-        time.sleep(0.1)
+        if self.simulate_timing:
+            time.sleep(0.1)
         
         return True
     
@@ -6,13 +6,27 @@ This module provides an example implementation of a stepper motor driver.
 In a real implementation, this would interface with hardware.
 """
 
-from motorControl import StepperDriver
+import logging
+import time
+
+from motor_bases import StepperDriver, register_driver
 from typing import Dict, Any
 
+_log = logging.getLogger(__name__)
+
+STEPS_PER_REVOLUTION = 200
+
+# Seconds per step at 1 RPM; divide by the speed in RPM for the step delay
+_STEP_DELAY_FACTOR = 60.0 / STEPS_PER_REVOLUTION
 
+
+@register_driver
 class ExampleStepperDriver(StepperDriver):
     """Example implementation of a stepper driver."""
     
+    __slots__ = ("position", "speed", "initialized", "step_pin", "dir_pin",
+                 "enable_pin", "microsteps", "simulate_timing")
+    
     def __init__(self):
         self.position = 0
         self.speed = 0.0
@@ -21,32 +35,38 @@ class ExampleStepperDriver(StepperDriver):
         self.dir_pin = None
         self.enable_pin = None
         self.microsteps = 1
+        self.simulate_timing = True
     
-    def initialize(self, **kwargs) -> bool:
+    def initialize(self, *, step_pin=None, dir_pin=None, enable_pin=None,
+                   microsteps: int = 1, simulate_timing: bool = True, **extras) -> bool:
         """Initialize the stepper driver with the given parameters."""
-        print(f"Initializing stepper driver with params: {kwargs}")
+        _log.debug("Initializing stepper driver")
+        if extras:
+            _log.debug("Ignoring unsupported parameters: %s", extras)
         
         # Required parameters
-        self.step_pin = kwargs.get('step_pin')
-        self.dir_pin = kwargs.get('dir_pin')
+        self.step_pin = step_pin
+        self.dir_pin = dir_pin
         
         if self.step_pin is None or self.dir_pin is None:
-            print("Error: step_pin and dir_pin parameters are required")
+            _log.error("step_pin and dir_pin parameters are required")
             return False
         
         # Optional parameters
-        self.enable_pin = kwargs.get('enable_pin')
-        self.microsteps = kwargs.get('microsteps', 1)
+        self.enable_pin = enable_pin
+        self.microsteps = microsteps
+        self.simulate_timing = simulate_timing
         
-        print(f"Using GPIO pins: step={self.step_pin}, dir={self.dir_pin}, enable={self.enable_pin}")
-        print(f"Microstepping: {self.microsteps}")
+        _log.debug("Using GPIO pins: step=%s, dir=%s, enable=%s",
+                   self.step_pin, self.dir_pin, self.enable_pin)
+        _log.debug("Microstepping: %s", self.microsteps)
         
         self.initialized = True
         return True
     
     def shutdown(self) -> bool:
         """Shutdown the stepper driver and release resources."""
-        print("Shutting down stepper driver")
+        _log.debug("Shutting down stepper driver")
         self.initialized = False
         return True
     
@@ -65,17 +85,18 @@ class ExampleStepperDriver(StepperDriver):
     def move_steps(self, steps: int, direction: bool = True) -> bool:
         """Move the stepper motor by the specified number of steps."""
         if not self.initialized:
-            print("Error: stepper driver not initialized")
+            _log.error("stepper driver not initialized")
             return False
         
         if steps <= 0:
-            print("Error: steps must be positive")
+            _log.error("steps must be positive")
             return False
         
         # In a real implementation, this would send step pulses to the hardware
-        print(f"Moving stepper {steps} steps {'forward' if direction else 'backward'}")
-        print(f"  Step pin: {self.step_pin}")
-        print(f"  Direction pin: {self.dir_pin} ({'HIGH' if direction else 'LOW'})")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Moving stepper %s steps %s (step pin: %s, direction pin: %s %s)",
+                       steps, "forward" if direction else "backward",
+                       self.step_pin, self.dir_pin, "HIGH" if direction else "LOW")
         
         # Update position
         if direction:
@@ -83,31 +104,33 @@ class ExampleStepperDriver(StepperDriver):
         else:
             self.position -= steps
         
-        # Simulate hardware delay based on speed
-        import time
-        if self.speed > 0:
-            # Calculate delay based on speed (RPM) and steps
-            # 60 seconds / (RPM * steps per revolution)
-            delay = 60.0 / (self.speed * 200)  # Assuming 200 steps per revolution
-            time.sleep(delay * steps)
-        else:
-            # Default delay if speed not set
-            time.sleep(0.01 * steps)
+        # Simulate the duration of the whole move with a single sleep; real
+        # hardware should hand the full pulse train to a timer peripheral
+        # rather than toggling the step pin from Python once per step
+        if self.simulate_timing:
+            if self.speed > 0:
+                # Calculate delay based on speed (RPM) and steps
+                # 60 seconds / (RPM * steps per revolution)
+                delay = _STEP_DELAY_FACTOR / self.speed
+                time.sleep(delay * steps)
+            else:
+                # Default delay if speed not set
+                time.sleep(0.01 * steps)
         
         return True
     
     def set_speed(self, rpm: float) -> bool:
         """Set the stepper motor speed in RPM."""
         if not self.initialized:
-            print("Error: stepper driver not initialized")
+            _log.error("stepper driver not initialized")
             return False
         
         if rpm < 0:
-            print("Error: speed cannot be negative")
+            _log.error("speed cannot be negative")
             return False
         
         self.speed = rpm
-        print(f"Setting stepper speed to {self.speed} RPM")
+        _log.debug("Setting stepper speed to %s RPM", self.speed)
         return True
     
     def get_position(self) -> int:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Motor Driver Base Classes
+
+This module defines the abstract base classes that motor drivers implement
+and the registry drivers add themselves to. It has no dependencies on the
+rest of the interface, so driver modules can import it cheaply. Everything
+here is re-exported by motorControl.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Tuple, Type
+
+
+class MotorDriver(ABC):
+    """Abstract base class for motor drivers."""
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def initialize(self, **kwargs) -> bool:
+        """Initialize the motor driver with the given parameters."""
+        pass
+    
+    @abstractmethod
+    def shutdown(self) -> bool:
+        """Shutdown the motor driver and release resources."""
+        pass
+    
+    @abstractmethod
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the current status of the motor.
+        
+        Must return a new dict on every call: Motor.get_status adds its own
+        fields to the returned dict in place rather than copying it.
+        """
+        pass
+    
+    def submit_many(self, commands: List[Tuple[str, tuple]]) -> List[Any]:
+        """
+        Execute a batch of driver commands and return their results in order.
+        
+        Each command is a (method name, args) pair. The default runs the
+        commands one after another; drivers for bus-attached hardware can
+        override this to send all updates in a single transaction.
+        """
+        return [getattr(self, command)(*args) for command, args in commands]
+
+
+class ServoDriver(MotorDriver):
+    """Base class for servo motor drivers."""
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def set_position(self, position: float) -> bool:
+        """Set the servo position in degrees (0-180)."""
+        pass
+    
+    @abstractmethod
+    def get_position(self) -> float:
+        """Get the current servo position in degrees."""
+        pass
+
+
+class StepperDriver(MotorDriver):
+    """Base class for stepper motor drivers."""
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def move_steps(self, steps: int, direction: bool = True) -> bool:
+        """Move the stepper motor by the specified number of steps."""
+        pass
+    
+    @abstractmethod
+    def set_speed(self, rpm: float) -> bool:
+        """Set the stepper motor speed in RPM."""
+        pass
+    
+    @abstractmethod
+    def get_position(self) -> int:
+        """Get the current position in steps."""
+        pass
+    
+    def get_speed(self) -> float:
+        """Get the current stepper motor speed in RPM from the speed attribute."""
+        return self.speed
+
+
+class BLDCDriver(MotorDriver):
+    """Base class for BLDC motor drivers."""
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def set_speed(self, rpm: float) -> bool:
+        """Set the BLDC motor speed in RPM."""
+        pass
+    
+    @abstractmethod
+    def set_direction(self, clockwise: bool) -> bool:
+        """Set the BLDC motor direction."""
+        pass
+    
+    @abstractmethod
+    def get_speed(self) -> float:
+        """Get the current BLDC motor speed in RPM."""
+        pass
+
+
+# Driver classes by full module path, populated by register_driver
+DRIVER_REGISTRY: Dict[str, Type[MotorDriver]] = {}
+
+
+def register_driver(cls):
+    """
+    Class decorator that registers a driver class under its module path.
+    
+    The class is registered as the driver of the module that defines it
+    (e.g. "drivers.example_servo_driver"), so MotorController resolves it
+    without scanning that module for a driver class.
+    
+    Example:
+        >>> @register_driver
+        ... class MyServoDriver(ServoDriver):
+        ...     ...
+    """
+    if not (isinstance(cls, type) and issubclass(cls, MotorDriver)):
+        raise TypeError(f"Driver {cls!r} must be a MotorDriver subclass")
+    DRIVER_REGISTRY[cls.__module__] = cls
+    return cls
@@ -6,8 +6,20 @@ This script demonstrates the usage of the universal motor control interface
 with different types of motors (Servo, Stepper, BLDC) and drivers.
 """
 
+import logging
 import time
-from motorControl import MotorController, MotorType
+from motorControl import MISSING, MotorController, MotorType
+from ramp import build_trapezoid
+
+# Per-command output inside motion loops; disabled when run with python -O
+VERBOSE = __debug__
+
+# Motor types and driver module names used by the examples
+_T_SERVO, _T_STEPPER, _T_BLDC = MotorType.SERVO, MotorType.STEPPER, MotorType.BLDC
+_DRV_SERVO, _DRV_STEPPER, _DRV_BLDC = (
+    "example_servo_driver", "example_stepper_driver", "example_bldc_driver")
+
+SERVO_POSITIONS = (0, 45, 90, 135, 180)
 
 
 def servo_example(controller: MotorController):
@@ -17,22 +29,22 @@ def servo_example(controller: MotorController):
     # Create a servo motor
     servo = controller.create_motor(
         "servo1",
-        MotorType.SERVO,
-        "example_servo_driver",
+        _T_SERVO,
+        _DRV_SERVO,
         pin=18
     )
     
     # Move to different positions
-    positions = [0, 45, 90, 135, 180]
-    for pos in positions:
-        print(f"\nMoving servo to {pos} degrees")
+    for pos in SERVO_POSITIONS:
+        if VERBOSE:
+            print(f"\nMoving servo to {pos} degrees")
         servo.set_position(pos)
-        print(f"Current position: {servo.get_position()} degrees")
+        if VERBOSE:
+            print(f"Current position: {servo.get_position()} degrees")
     
     # Get motor status
     print("\nServo status:")
-    status = servo.get_status()
-    for key, value in status.items():
+    for key, value in servo.iter_status():
         print(f"  {key}: {value}")
 
 
@@ -43,8 +55,8 @@ def stepper_example(controller: MotorController):
     # Create a stepper motor
     stepper = controller.create_motor(
         "stepper1",
-        MotorType.STEPPER,
-        "example_stepper_driver",
+        _T_STEPPER,
+        _DRV_STEPPER,
         step_pin=17,
         dir_pin=27,
         enable_pin=22,
@@ -67,8 +79,7 @@ def stepper_example(controller: MotorController):
     
     # Get motor status
     print("\nStepper status:")
-    status = stepper.get_status()
-    for key, value in status.items():
+    for key, value in stepper.iter_status():
         print(f"  {key}: {value}")
 
 
@@ -79,8 +90,8 @@ def bldc_example(controller: MotorController):
     # Create a BLDC motor
     bldc = controller.create_motor(
         "bldc1",
-        MotorType.BLDC,
-        "example_bldc_driver",
+        _T_BLDC,
+        _DRV_BLDC,
         pwm_pin=22,
         hall_sensor_pins=[23, 24, 25],
         max_speed=5000
@@ -90,11 +101,17 @@ def bldc_example(controller: MotorController):
     print("\nSetting direction to clockwise")
     bldc.set_direction(True)
     
-    # Ramp up speed
+    # Ramp up speed, reading the speed back once after the ramp
     print("\nRamping up speed")
-    for speed in range(0, 5001, 1000):
+    # Ramps run at 1000 RPM/s with one setpoint per second; they are built
+    # here rather than at import so importing this module never JIT-compiles
+    commanded = []
+    for speed in build_trapezoid(0.0, 5000.0, 1000.0, 1.0, 5):
+        speed = float(speed)
         bldc.set_speed(speed)
-        print(f"Current speed: {bldc.get_speed()} RPM")
+        commanded.append(speed)
+    print(f"Commanded speeds: {commanded} RPM")
+    print(f"Current speed: {bldc.get_speed()} RPM")
     
     # Change direction
     print("\nChanging direction to counterclockwise")
@@ -102,14 +119,17 @@ def bldc_example(controller: MotorController):
     
     # Ramp down speed
     print("\nRamping down speed")
-    for speed in range(5000, -1, -1000):
+    commanded = []
+    for speed in build_trapezoid(5000.0, 0.0, 1000.0, 1.0, 5):
+        speed = float(speed)
         bldc.set_speed(speed)
-        print(f"Current speed: {bldc.get_speed()} RPM")
+        commanded.append(speed)
+    print(f"Commanded speeds: {commanded} RPM")
+    print(f"Current speed: {bldc.get_speed()} RPM")
     
     # Get motor status
     print("\nBLDC status:")
-    status = bldc.get_status()
-    for key, value in status.items():
+    for key, value in bldc.iter_status():
         print(f"  {key}: {value}")
 
 
@@ -120,15 +140,15 @@ def multi_motor_example(controller: MotorController):
     # Create all motor types
     servo = controller.create_motor(
         "servo2",
-        MotorType.SERVO,
-        "example_servo_driver",
+        _T_SERVO,
+        _DRV_SERVO,
         pin=18
     )
     
     stepper = controller.create_motor(
         "stepper2",
-        MotorType.STEPPER,
-        "example_stepper_driver",
+        _T_STEPPER,
+        _DRV_STEPPER,
         step_pin=17,
         dir_pin=27,
         enable_pin=22
@@ -136,8 +156,8 @@ def multi_motor_example(controller: MotorController):
     
     bldc = controller.create_motor(
         "bldc2",
-        MotorType.BLDC,
-        "example_bldc_driver",
+        _T_BLDC,
+        _DRV_BLDC,
         pwm_pin=22
     )
     
@@ -148,19 +168,22 @@ def multi_motor_example(controller: MotorController):
     bldc.set_direction(True)
     bldc.set_speed(1000)
     
-    # Move all motors
+    # Move all motors in a single batch
     print("\nMoving all motors:")
-    servo.set_position(45)
-    stepper.move_steps(100, True)
-    bldc.set_speed(2000)
+    controller.apply_batch([
+        (servo, "set_position", (45,)),
+        (stepper, "move_steps", (100, True)),
+        (bldc, "set_speed", (2000,)),
+    ])
     
     # Get status of all motors
     print("\nAll motors status:")
-    for motor_status in controller.list_motors():
-        print(f"\nMotor: {motor_status['name']}")
-        for key, value in motor_status.items():
-            if key != 'name':
-                print(f"  {key}: {value}")
+    names, columns = controller.status_table()
+    for i, name in enumerate(names):
+        print(f"\nMotor: {name}")
+        for key, column in columns.items():
+            if column[i] is not MISSING:
+                print(f"  {key}: {column[i]}")
 
 
 def run_all_examples():
@@ -182,4 +205,5 @@ def run_all_examples():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     run_all_examples() 
\ No newline at end of file
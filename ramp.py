@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Speed Ramp Profiles
+
+This module generates acceleration-limited speed setpoints for ramping a
+motor from one speed to another. When Numba is installed the profile loop is
+JIT-compiled and returns a NumPy array; otherwise it runs as plain Python and
+returns a list.
+
+Example:
+    >>> from ramp import build_trapezoid
+    >>> for speed in build_trapezoid(0.0, 5000.0, 1000.0, 1.0, 5):
+    ...     bldc.set_speed(speed)
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+def _fill_trapezoid(out, v0: float, v1: float, accel: float, dt: float):
+    """Fill out with setpoints stepping from v0 towards v1, holding at v1."""
+    step = accel * dt if v1 > v0 else -accel * dt
+    v = v0
+    for i in range(len(out)):
+        v += step
+        if (step > 0 and v > v1) or (step < 0 and v < v1):
+            v = v1
+        out[i] = v
+    return out
+
+
+if njit is not None:
+    _fill_trapezoid = njit(cache=True, fastmath=True)(_fill_trapezoid)
+
+
+def build_trapezoid(v0: float, v1: float, accel: float, dt: float, n: int):
+    """
+    Build a ramp of speed setpoints from v0 towards v1.
+    
+    Args:
+        v0: Starting speed.
+        v1: Target speed.
+        accel: Maximum change in speed per second.
+        dt: Time between setpoints in seconds.
+        n: Number of setpoints to generate.
+    
+    Returns:
+        n setpoints, excluding v0; once v1 is reached it is held.
+        
+    Raises:
+        ValueError: If accel or dt is not positive, or n is negative.
+    """
+    if accel <= 0:
+        raise ValueError(f"accel must be positive, got {accel}")
+    if dt <= 0:
+        raise ValueError(f"dt must be positive, got {dt}")
+    if n < 0:
+        raise ValueError(f"n must not be negative, got {n}")
+    
+    if np is not None:
+        out = np.empty(n, dtype=np.float64)
+    else:
+        out = [0.0] * n
+    return _fill_trapezoid(out, float(v0), float(v1), float(accel), float(dt))